@@ -21,69 +21,56 @@ The above copyright notice and this permission notice shall be included in all c
 THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
-import adsk.core
-import traceback
+from importlib import import_module
 
 
-try:
-    from . import config
-    from .apper import apper
-    from .commands.DXFImportCommand import DXFImportCommand, CloseGapsCommand
+def _create_addin():
+    config = import_module('.config', __package__)
+    apper = import_module('.apper.apper', __package__)
+    commands = import_module('.commands.DXFImportCommand', __package__)
 
     # Create our addin definition object
-    my_addin = apper.FusionApp(config.app_name, config.company_name, False)
-    my_addin.root_path = config.app_path
-
-    # General command showing inputs and user interaction
-    my_addin.add_command(
-        'DXF Bulk Import',
-        DXFImportCommand,
-        {
-            'cmd_description': 'Import multiple DXF Files',
-            'cmd_id': 'dxf_import_cmd',
-            'workspace': 'FusionSolidEnvironment',
-            'toolbar_panel_id': 'DXF Import',
-            'toolbar_tab_name': 'TOOLS',
-            'toolbar_tab_id': 'ToolsTab',
-            'cmd_resources': 'command_icons',
-            'command_visible': True,
-            'command_promoted': True,
-
-        }
-    )
-
-    # General command showing inputs and user interaction
-    my_addin.add_command(
-        'Close Sketch Gaps',
-        CloseGapsCommand,
-        {
-            'cmd_description': 'Close any gaps within tolerance in a Sketch (Like from an imported DXF File)',
-            'cmd_id': 'dxf_gap_cmd',
-            'workspace': 'FusionSolidEnvironment',
-            'toolbar_panel_id': 'DXF Import',
-            'toolbar_tab_name': 'TOOLS',
-            'toolbar_tab_id': 'ToolsTab',
-            'cmd_resources': 'command_icons',
-            'command_visible': True,
-            'command_promoted': False,
-
-        }
-    )
-
-except:
-    app = adsk.core.Application.get()
-    ui = app.userInterface
-    if ui:
-        ui.messageBox('Initialization: {}'.format(traceback.format_exc()))
+    addin = apper.FusionApp(config.app_name, config.company_name, False)
+    addin.root_path = config.app_path
+
+    # add_command() writes into the options it is given, so pass a copy
+    for title, class_name, options in config.addin_commands:
+        addin.add_command(title, getattr(commands, class_name), dict(options))
+
+    return addin
+
 
 # Set to True to display various useful messages when debugging your app
 debug = False
 
+# Built by run() so importing this module does not construct the add-in
+my_addin = None
+
 
 def run(context):
+    global my_addin
+
+    from .startup import setup_app
+    setup_app()
+
+    if my_addin is None:
+        try:
+            my_addin = _create_addin()
+        except:
+            import traceback
+            import adsk.core
+            app = adsk.core.Application.get()
+            ui = app.userInterface
+            if ui:
+                ui.messageBox(f'Initialization: {traceback.format_exc()}')
+            return
+
     my_addin.run_app()
 
 
 def stop(context):
-    my_addin.stop_app()
+    if my_addin is not None:
+        my_addin.stop_app()
 
+    from .startup import cleanup_app
+    cleanup_app()
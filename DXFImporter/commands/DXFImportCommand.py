@@ -25,19 +25,31 @@ import json
 import logging
 import sys
 import traceback
+from functools import lru_cache
 from importlib import reload
 
 import adsk.core
 import adsk.fusion
 
 import os
-from math import floor
+from math import ceil, floor, sqrt
 
 from ..apper import apper
 from .. import config
 from . import EZDXFCommands
 
 
+# Factory functions used for every moved sketch and occurrence, resolved once
+_create_object_collection = adsk.core.ObjectCollection.create
+# Only available in newer versions of the Fusion 360 API
+_create_object_collection_with_array = getattr(adsk.core.ObjectCollection, 'createWithArray', None)
+_create_vector = adsk.core.Vector3D.create
+_create_matrix = adsk.core.Matrix3D.create
+
+# Number of files imported between UI updates
+DO_EVENTS_INTERVAL = 8
+
+
 def validate_workspace(command: adsk.core.Command):
     command.isExecutedWhenPreEmpted = False
     ao = apper.AppObjects()
@@ -50,85 +62,96 @@ def validate_workspace(command: adsk.core.Command):
 # Extract file names of all dxf files in a directory
 def get_dxf_files(file_names):
     dxf_files = []
+    append = dxf_files.append
+    basename = os.path.basename
+    splitext = os.path.splitext
 
     for filename in file_names:
+        base_name = basename(filename)
+        name, ext = splitext(base_name)
 
-        if filename.endswith(".dxf") or filename.endswith(".DXF"):
-            base_name = os.path.basename(filename)
-            dxf_file = {
+        # Case-insensitive, also accepts mixed case like .Dxf
+        if ext.lower() == ".dxf":
+            append({
                 'full_path': filename,
-                'name': base_name[:-4],
+                'name': name,
                 'base_name': base_name
-            }
-            dxf_files.append(dxf_file)
-        else:
-            continue
+            })
 
     return dxf_files
 
 
-def get_delta_vector(fusion_object) -> adsk.core.Vector3D:
-    max_point = fusion_object.boundingBox.maxPoint
-    min_point = fusion_object.boundingBox.minPoint
-    delta_vector = adsk.core.Vector3D.create(max_point.x - min_point.x,
-                                             max_point.y - min_point.y,
-                                             max_point.z - min_point.z)
-
-    return delta_vector
+# Returns the size of a bounding box along each axis, reading each corner point once
+def get_bb_extents(bounding_box: adsk.core.BoundingBox3D):
+    max_point = bounding_box.maxPoint
+    min_point = bounding_box.minPoint
+    return max_point.x - min_point.x, max_point.y - min_point.y, max_point.z - min_point.z
 
 
 def bounding_box_volume(fusion_object):
-    max_point = fusion_object.boundingBox.maxPoint
-    min_point = fusion_object.boundingBox.minPoint
-    bb_volume = (max_point.x - min_point.x) * (max_point.y - min_point.y) * (max_point.z - min_point.z)
-    return bb_volume
-
+    x_extent, y_extent, z_extent = get_bb_extents(fusion_object.boundingBox)
+    return x_extent * y_extent * z_extent
 
-# Returns the magnitude of the bounding box in the specified direction
-def get_bb_in_direction(fusion_object, direction_vector):
-    delta_vector = get_delta_vector(fusion_object)
-
-    # Get bounding box delta in specified direction
-    delta = delta_vector.dotProduct(direction_vector)
-    return delta
 
+# Transforms an occurrence by the specified amounts in x and y with a single transform update
+def transform_along_xy(occurrence, x_magnitude, y_magnitude):
+    # The first part of the first row stays where it is
+    if x_magnitude == 0.0 and y_magnitude == 0.0:
+        return
 
-# Transforms an occurrence along a specified vector by a specified amount
-def transform_along_vector(occurrence, direction_vector, magnitude):
     # Create a vector for the translation
-    vector = direction_vector.copy()
-    vector.scaleBy(magnitude)
+    vector = _create_vector(x_magnitude, y_magnitude, 0.0)
     transform = transform_from_vector(occurrence, vector)
     # Transform Component
     occurrence.transform = transform
 
 
 def move_to_origin(occurrence: adsk.fusion.Occurrence):
-    vector = occurrence.boundingBox.minPoint.asVector()
-    vector.scaleBy(-1.0)
+    min_point = occurrence.boundingBox.minPoint
+    vector = _create_vector(-min_point.x, -min_point.y, -min_point.z)
     transform = transform_from_vector(occurrence, vector)
     # Transform Component
     occurrence.transform = transform
 
 
 def move_sketch_by_transform(sketch, transform):
-    all_sketch_entities = adsk.core.ObjectCollection.create()
+    sketch_curves = sketch.sketchCurves
+    sketch_texts = sketch.sketchTexts
+    curve_count = sketch_curves.count
+    text_count = sketch_texts.count
+
+    # Nothing to move
+    if curve_count == 0 and text_count == 0:
+        return
 
-    if sketch.sketchCurves.count > 0:
-        for entity in sketch.sketchCurves:
-            all_sketch_entities.add(entity)
-    if sketch.sketchTexts.count > 0:
-        for text_entity in sketch.sketchTexts:
-            all_sketch_entities.add(text_entity)
+    get_curve = sketch_curves.item
+    get_text = sketch_texts.item
+    entities = [get_curve(i) for i in range(curve_count)]
+    entities.extend(get_text(i) for i in range(text_count))
+
+    if _create_object_collection_with_array is not None:
+        # Hand the whole list to the API in one call
+        all_sketch_entities = _create_object_collection_with_array(entities)
+    else:
+        all_sketch_entities = _create_object_collection()
+        add_entity = all_sketch_entities.add
+        for entity in entities:
+            add_entity(entity)
 
     sketch.move(all_sketch_entities, transform)
 
 
-def move_sketch_to_origin(sketch: adsk.fusion.Sketch):
-    vector = sketch.boundingBox.minPoint.asVector()
-    vector.scaleBy(-1.0)
-    new_transform = adsk.core.Matrix3D.create()
-    new_transform.translation = vector
+def move_sketch_to_origin(sketch: adsk.fusion.Sketch, bounding_box: adsk.core.BoundingBox3D = None):
+    if bounding_box is None:
+        bounding_box = sketch.boundingBox
+    min_point = bounding_box.minPoint
+    new_transform = _create_matrix()
+
+    # Already at the origin, nothing to move
+    if abs(min_point.x) + abs(min_point.y) + abs(min_point.z) < 1e-12:
+        return new_transform
+
+    new_transform.translation = _create_vector(-min_point.x, -min_point.y, -min_point.z)
 
     move_sketch_by_transform(sketch, new_transform)
 
@@ -136,11 +159,12 @@ def move_sketch_to_origin(sketch: adsk.fusion.Sketch):
 
 
 def transform_from_vector(occurrence, vector):
-    # Create a transform to do move
-    old_transform = adsk.core.Matrix3D.cast(occurrence.transform)
-    new_transform = adsk.core.Matrix3D.create()
-    new_transform.translation = vector
-    old_transform.transformBy(new_transform)
+    # Occurrence.transform already returns a new Matrix3D, no cast needed
+    old_transform = occurrence.transform
+    # A pure translation only shifts the translation column, no need to multiply matrices
+    translation = old_transform.translation
+    translation.add(vector)
+    old_transform.translation = translation
     return old_transform
 
 
@@ -158,41 +182,21 @@ def create_extrude(profile: adsk.fusion.Profile, component: adsk.fusion.Componen
         return success
 
 
-def extrude_largest_profile(sketch: adsk.fusion.Sketch, component: adsk.fusion.Component, distance: float):
-    if sketch.profiles.count == 0:
-        return
-
-    else:
-        the_profile = sketch.profiles.item(0)
-        operation = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
-        success = False
-
-        success = create_extrude(the_profile, component, distance, operation, success)
-
-        if sketch.profiles.count > 1:
-            # the_profile = adsk.core.ObjectCollection.create()
-            for i in range(1, sketch.profiles.count):
-                if success:
-                    operation = adsk.fusion.FeatureOperations.JoinFeatureOperation
-                success = create_extrude(sketch.profiles.item(i), component, distance, operation, success)
+def get_profiles(sketch: adsk.fusion.Sketch):
+    profiles = sketch.profiles
+    profile_count = profiles.count
+    get_profile = profiles.item
+    return [get_profile(i) for i in range(profile_count)]
 
 
 # extrude the first profile with the largest number of holes
 def extrude_profile_with_most_loops(sketch: adsk.fusion.Sketch, component: adsk.fusion.Component, distance: float):
-    if sketch.profiles.count == 0:
+    profiles = get_profiles(sketch)
+    if len(profiles) == 0:
         return
     else:
-        # start with the first profile
-        the_profile = sketch.profiles.item(0)
-        the_profile_loop_count = the_profile.profileLoops.count
-        # find the profile with the most loops
-        if sketch.profiles.count > 1:
-            for i in range(1, sketch.profiles.count):
-                next_profile = sketch.profiles.item(i)
-                next_profile_loop_count = next_profile.profileLoops.count
-                if next_profile_loop_count > the_profile_loop_count:
-                    the_profile = next_profile
-                    the_profile_loop_count = next_profile_loop_count
+        # find the profile with the most loops, the first one wins a tie
+        the_profile = max(profiles, key=lambda profile: profile.profileLoops.count)
         operation = adsk.fusion.FeatureOperations.NewBodyFeatureOperation
         success = False
         face = create_extrude(the_profile, component, distance, operation, success)
@@ -247,49 +251,61 @@ def get_materials():
     return material_list
 
 
-def process_dxf_files(dxf_files, input_values, material, logger: logging.Logger):
-    ao = apper.AppObjects()
-    # Start a time line group
-    start_index = apper.start_group()
+def get_layout_attribute(attributes: adsk.core.Attributes, name, value_type, default):
+    attribute = attributes.itemByName("DXFer", name)
+    if attribute is None:
+        return default
+    return value_type(attribute.value)
 
-    y_magnitude_attribute = ao.design.attributes.itemByName("DXFer", "y_magnitude")
-    x_magnitude_attribute = ao.design.attributes.itemByName("DXFer", "x_magnitude")
-    row_count_attribute = ao.design.attributes.itemByName("DXFer", "row_count")
-    y_row_max_attribute = ao.design.attributes.itemByName("DXFer", "y_row_max")
 
-    if y_magnitude_attribute is None:
-        y_magnitude = 0.0
-    else:
-        y_magnitude = float(y_magnitude_attribute.value)
+def save_layout_attributes(attributes: adsk.core.Attributes, **values):
+    for name, value in values.items():
+        attributes.add("DXFer", name, str(value))
 
-    if x_magnitude_attribute is None:
-        x_magnitude = 0.0
-    else:
-        x_magnitude = float(x_magnitude_attribute.value)
 
-    if row_count_attribute is None:
-        row_count = 0
-    else:
-        row_count = int(row_count_attribute.value)
+def process_dxf_files(dxf_files, input_values, material, logger: logging.Logger):
+    # Nothing to import, don't leave an empty group in the timeline
+    if len(dxf_files) == 0:
+        return
 
-    if y_row_max_attribute is None:
-        y_row_max = 0.0
-    else:
-        y_row_max = float(y_row_max_attribute.value)
+    ao = apper.AppObjects()
+    # Start a time line group
+    start_index = apper.start_group()
 
-    # Define spacing and directions
-    x_vector = adsk.core.Vector3D.create(1.0, 0.0, 0.0)
-    y_vector = adsk.core.Vector3D.create(0.0, 1.0, 0.0)
+    # Layout position left by any previous import into this design
+    attributes = ao.design.attributes
+    y_magnitude = get_layout_attribute(attributes, "y_magnitude", float, 0.0)
+    x_magnitude = get_layout_attribute(attributes, "x_magnitude", float, 0.0)
+    row_count = get_layout_attribute(attributes, "row_count", int, 0)
+    y_row_max = get_layout_attribute(attributes, "y_row_max", float, 0.0)
+
+    # Command options, read once for the whole batch
+    single_sketch = input_values['single_sketch']
+    close_sketches = input_values['close_sketches']
+    tolerance = input_values['tolerance_input']
+    reset_origins = input_values['reset_option_input']
+    extrude_profiles = input_values['extrude_option_input']
+    distance = input_values['distance']
+    keep_sketches_shown = input_values['keep_sketches_shown']
+    import_text = input_values['import_text']
+    font_selection = input_values['font_selection']
+    spacing = input_values['spacing']
+    rows = input_values['rows']
+    if rows == 0:
+        # Auto layout, roughly square grid of parts
+        rows = ceil(sqrt(len(dxf_files)))
+
+    last_index = len(dxf_files) - 1
 
     # Iterate all dxf files and create components
-    for dxf_file in dxf_files:
+    for index, dxf_file in enumerate(dxf_files):
         # Create new component for this DXF file
         occurrence = apper.create_component(ao.root_comp, dxf_file['name'])
         sketches = apper.import_dxf(
             dxf_file['full_path'],
             occurrence.component,
             occurrence.component.xYConstructionPlane,
-            input_values['single_sketch']
+            single_sketch
         )
         logger.info(f"Imported DXF File: {dxf_file['name']}")
         x_delta = 0
@@ -299,30 +315,28 @@ def process_dxf_files(dxf_files, input_values, material, logger: logging.Logger)
         extrude_sketch_transform = None
         for sketch in sketches:
 
-            if input_values['close_sketches']:
-                tolerance = input_values['tolerance_input']
+            if close_sketches:
                 close_sketch_gaps(sketch, tolerance, logger)
 
-            if input_values['reset_option_input']:
-                sketch_transform = move_sketch_to_origin(sketch)
+            # Read the sketch extents once, moving the sketch does not change its size
+            bounding_box = sketch.boundingBox
+            x_extent, y_extent, _ = get_bb_extents(bounding_box)
 
-            x_delta_check = get_bb_in_direction(sketch, x_vector)
-            if x_delta_check > x_delta:
-                x_delta = x_delta_check
-            y_delta_check = get_bb_in_direction(sketch, y_vector)
-            if y_delta_check > y_delta:
-                y_delta = y_delta_check
+            if reset_origins:
+                sketch_transform = move_sketch_to_origin(sketch, bounding_box)
 
-            if input_values['extrude_option_input']:
-                # extrude_largest_profile(sketch, occurrence.component, input_values['distance'])
-                this_face = extrude_profile_with_most_loops(sketch, occurrence.component, input_values['distance'])
+            x_delta = max(x_delta, x_extent)
+            y_delta = max(y_delta, y_extent)
+
+            if extrude_profiles:
+                this_face = extrude_profile_with_most_loops(sketch, occurrence.component, distance)
                 if this_face:
                     face = this_face
                     extrude_sketch_transform = sketch_transform
-                if input_values['keep_sketches_shown']:
+                if keep_sketches_shown:
                     sketch.isLightBulbOn = True
 
-        if input_values['import_text']:
+        if import_text:
             # Alternative to create sketch on extrude cap face, having transform issues.
             if face:
                 text_sketch = occurrence.component.sketches.add(face)
@@ -333,12 +347,11 @@ def process_dxf_files(dxf_files, input_values, material, logger: logging.Logger)
             text_sketch.name = 'TEXT'
 
             # Import text with EZDXF Library
-            font_selection = input_values['font_selection']
             EZDXFCommands.import_dxf_text(dxf_file['full_path'], text_sketch, font_selection, logger)
 
             if text_sketch.sketchTexts.count == 0:
                 text_sketch.deleteMe()
-            elif input_values['reset_option_input']:
+            elif reset_origins:
                 if extrude_sketch_transform is not None:
                     move_sketch_by_transform(text_sketch, extrude_sketch_transform)
                 elif sketch_transform is not None:
@@ -346,28 +359,28 @@ def process_dxf_files(dxf_files, input_values, material, logger: logging.Logger)
 
             # EZDXFCommands.import_dxf_text(dxf_file['full_path'], occurrence.component, font_selection)
 
-        if not input_values['reset_option_input']:
+        if not reset_origins:
             move_to_origin(occurrence)
         # Move component in specified direction
-        transform_along_vector(occurrence, x_vector, x_magnitude)
-        transform_along_vector(occurrence, y_vector, y_magnitude)
+        transform_along_xy(occurrence, x_magnitude, y_magnitude)
 
-        # Update document and capture position of new component
-        adsk.doEvents()
+        # Update document every few files and after the last one
+        if (index + 1) % DO_EVENTS_INTERVAL == 0 or index == last_index:
+            adsk.doEvents()
+        # Capture position of new component before the next file triggers a recompute
         if ao.design.snapshots.hasPendingSnapshot:
             ao.design.snapshots.add()
 
         # Increment magnitude by desired component size and spacing
-        x_magnitude += input_values['spacing']
+        x_magnitude += spacing
         x_magnitude += x_delta
         row_count += 1
 
-        if y_delta > y_row_max:
-            y_row_max = y_delta
+        y_row_max = max(y_row_max, y_delta)
 
         # Move to next row
-        if row_count >= input_values['rows']:
-            y_magnitude += input_values['spacing']
+        if row_count >= rows:
+            y_magnitude += spacing
             y_magnitude += y_row_max
             y_row_max = 0.0
             x_magnitude = 0.0
@@ -376,10 +389,9 @@ def process_dxf_files(dxf_files, input_values, material, logger: logging.Logger)
         if material is not None:
             occurrence.component.material = material
 
-    ao.design.attributes.add("DXFer", "y_magnitude", str(y_magnitude))
-    ao.design.attributes.add("DXFer", "x_magnitude", str(x_magnitude))
-    ao.design.attributes.add("DXFer", "row_count", str(row_count))
-    ao.design.attributes.add("DXFer", "y_row_max", str(y_row_max))
+    save_layout_attributes(
+        attributes, y_magnitude=y_magnitude, x_magnitude=x_magnitude, row_count=row_count, y_row_max=y_row_max
+    )
 
     # Close time line group
     apper.end_group(start_index)
@@ -405,75 +417,75 @@ def save_settings(inputs: adsk.core.CommandInputs, fusion_app: apper.FusionApp):
     fusion_app.save_preferences("DEFAULT", new_prefs, False)
 
 
-def close_sketch_gaps(sketch: adsk.fusion.Sketch, tolerance, logger: logging.Logger):
-    ao = apper.AppObjects()
+# Returns (i, j) index pairs of points that are within tolerance of each other
+def find_gap_pairs(coordinates, tolerance):
+    # Cells are one tolerance wide so the 3x3 neighborhood covers the whole search radius
+    factor = 1.0 / max(tolerance, 1e-9)
+
+    # Sparse grid, only cells holding a point are stored: (x_pos, y_pos) -> [(index, (x, y, z)), ...]
+    grid = {}
+    tolerance_squared = tolerance * tolerance
+    pairs = []
+    for index, (x, y, z) in enumerate(coordinates):
+        x_pos: int = int(floor(factor * x))
+        y_pos: int = int(floor(factor * y))
+        point_merged = False
+
+        # Check this cell and its 8 neighbors
+        for x_key in (x_pos - 1, x_pos, x_pos + 1):
+            for y_key in (y_pos - 1, y_pos, y_pos + 1):
+                point_check_list = grid.get((x_key, y_key))
+                if point_check_list is None:
+                    continue
+                for check_index, (check_x, check_y, check_z) in point_check_list:
+                    dx, dy, dz = x - check_x, y - check_y, z - check_z
+                    if dx * dx + dy * dy + dz * dz <= tolerance_squared:
+                        pairs.append((index, check_index))
+                        point_merged = True
+
+        # Points that were merged are not candidates for later points
+        if not point_merged:
+            grid.setdefault((x_pos, y_pos), []).append((index, (x, y, z)))
+
+    return pairs
 
-    # factor = int(floor(1/tolerance))
 
+def close_sketch_gaps(sketch: adsk.fusion.Sketch, tolerance, logger: logging.Logger):
     bounding_box = sketch.boundingBox
-    min_x = bounding_box.minPoint.x
-    min_y = bounding_box.minPoint.y
-    max_x = bounding_box.maxPoint.x
-    max_y = bounding_box.maxPoint.y
-
-    factor = int(floor(2000 / ((max_x - min_x) + (max_y - min_y))))
-
-    x_range = int(floor(factor * (max_x - min_x)))
-    y_range = int(floor(factor * (max_y - min_y)))
-    trans_x = round(0 - min_x, 6)
-    trans_y = round(0 - min_y, 6)
-
-    # Debug
-    # str_comp = str(x_range) + ', ' + str(y_range)
-    # ao.ui.messageBox(str_comp)
-    #
-    # str_comp = str(trans_x) + ', ' + str(trans_y)
-    # ao.ui.messageBox(str_comp)
-
-    grid = [[[] for i in range(x_range + 2)] for j in range(y_range + 2)]
-    str_list = []
-    constrained_points: int = 0
+
+    # Read the geometry of every candidate point once, up front
+    sketch_points = []
+    coordinates = []
     sketch_point: adsk.fusion.SketchPoint
     for sketch_point in sketch.sketchPoints:
         if sketch_point.geometry.z == 0:
-            if bounding_box.contains(sketch_point.worldGeometry):
-                x_pos: int = int(floor(factor * (trans_x + sketch_point.worldGeometry.x)))
-                y_pos: int = int(floor(factor * (trans_y + sketch_point.worldGeometry.y)))
-                point_check_list = grid[y_pos][x_pos]
-                point_merged = False
-                for point_check in point_check_list:
-                    if isinstance(point_check, adsk.fusion.SketchPoint):
-                        if sketch_point.worldGeometry.distanceTo(point_check.worldGeometry) <= tolerance:
-                            try:
-                                sketch.geometricConstraints.addCoincident(sketch_point, point_check)
-                                constrained_points += 1
-                                point_merged = True
-
-                            except:
-                                logger.error(f"Constrain Points Error: {traceback.format_exc(2)}")
-
-                if not point_merged:
-                    grid[y_pos][x_pos].append(sketch_point)
-                    grid[y_pos + 1][x_pos].append(sketch_point)
-                    grid[y_pos - 1][x_pos].append(sketch_point)
-                    grid[y_pos][x_pos + 1].append(sketch_point)
-                    grid[y_pos + 1][x_pos + 1].append(sketch_point)
-                    grid[y_pos - 1][x_pos + 1].append(sketch_point)
-                    grid[y_pos][x_pos - 1].append(sketch_point)
-                    grid[y_pos + 1][x_pos - 1].append(sketch_point)
-                    grid[y_pos - 1][x_pos - 1].append(sketch_point)
-
-                str_list.append(str(x_pos) + ', ' + str(y_pos))
-
-        # ao.ui.messageBox(str(str_list))
-    # if merged_points > 0:
-    #     ao.ui.messageBox(f"Number of merged points: {merged_points}")
+            world_point = sketch_point.worldGeometry
+            if bounding_box.contains(world_point):
+                sketch_points.append(sketch_point)
+                coordinates.append((world_point.x, world_point.y, world_point.z))
+
+    constrained_points: int = 0
+    geometric_constraints = sketch.geometricConstraints
+
+    # Solve the sketch once after all of the constraints are added, not after each one
+    sketch.isComputeDeferred = True
+    try:
+        for index, check_index in find_gap_pairs(coordinates, tolerance):
+            try:
+                geometric_constraints.addCoincident(sketch_points[index], sketch_points[check_index])
+                constrained_points += 1
+
+            except:
+                logger.error(f"Constrain Points Error: {traceback.format_exc(2)}")
+    finally:
+        sketch.isComputeDeferred = False
+
     if constrained_points > 0:
         logger.info(f"There were {constrained_points} gaps closed in {sketch.parentComponent.name} - {sketch.name}")
 
 
 def get_tooltips():
-    file_name = os.path.join(config.app_path, 'commands', 'resources', 'tooltips.json')
+    file_name = config.tooltips_file
     tooltips_dict = {}
     if os.path.exists(file_name):
         with open(file_name) as f:
@@ -485,10 +497,19 @@ def get_tooltips():
     return tooltips_dict
 
 
+# fonts.txt ships with the add-in and does not change while it is running
+@lru_cache(maxsize=1)
+def get_fonts():
+    with open(config.fonts_file) as f:
+        return tuple(f.read().splitlines())
+
+
 def set_tool_tips(command_inputs: adsk.core.CommandInputs, tool_tips_dict):
     command_input: adsk.core.CommandInput
-    for i in range(command_inputs.count):
-        command_input = command_inputs.item(i)
+    input_count = command_inputs.count
+    get_input = command_inputs.item
+    for i in range(input_count):
+        command_input = get_input(i)
         tip_text = tool_tips_dict.get(command_input.id, False)
         if tip_text:
             command_input.tooltipDescription = tip_text
@@ -505,7 +526,7 @@ class DXFImportCommand(apper.Fusion360CommandBase):
         self.tooltips = get_tooltips()
 
         if not bool(self.fusion_app.preferences):
-            file_name = os.path.join(config.app_path, "default_preferences.json")
+            file_name = config.default_preferences_file
             default_preferences = self.fusion_app.read_json_file(file_name)
             self.fusion_app.initialize_preferences(default_preferences)
 
@@ -522,6 +543,7 @@ class DXFImportCommand(apper.Fusion360CommandBase):
         material = None
         drop_down_input = command_inputs.itemById('material_selection')
         if apply_material and (drop_down_input.listItems.count > 0):
+            # Drop down items are added in material_list order
             material_index = drop_down_input.selectedItem.index
             material = self.material_list[material_index]['material']
 
@@ -530,7 +552,7 @@ class DXFImportCommand(apper.Fusion360CommandBase):
 
     def on_create(self, command, command_inputs: adsk.core.CommandInputs):
         validate_workspace(command)
-        command.helpFile = os.path.join(config.app_path, "HelpFile.html")
+        command.helpFile = config.help_file
         self.file_names = []
         self.material_list = get_materials()
         ao = apper.AppObjects()
@@ -564,8 +586,8 @@ class DXFImportCommand(apper.Fusion360CommandBase):
         # Spacing between DXF's
         command_inputs.addValueInput('spacing', 'Spacing between parts: ', default_units, default_spacing)
 
-        # Number of components per rows
-        command_inputs.addIntegerSpinnerCommandInput('rows', 'Number per row: ', 1, 999, 1, default_parts_per_row)
+        # Number of components per rows, 0 lays the files out in a square grid
+        command_inputs.addIntegerSpinnerCommandInput('rows', 'Number per row: ', 0, 999, 1, default_parts_per_row)
 
         # Resets DXF origin to minimum of the profiles bounding box
         command_inputs.addBoolValueInput(
@@ -593,33 +615,34 @@ class DXFImportCommand(apper.Fusion360CommandBase):
         drop_down_input = command_inputs.addDropDownCommandInput(
             "material_selection", "Material Name", adsk.core.DropDownStyles.TextListDropDownStyle
         )
+        material_items = drop_down_input.listItems
         if len(self.material_list) > 0:
             default_material_index = 0
             for i, material_object in enumerate(self.material_list):
-                drop_down_input.listItems.add(material_object['name'], False)
+                material_items.add(material_object['name'], False)
                 if material_object['name'] == default_material:
                     default_material_index = i
 
-            drop_down_input.listItems.item(default_material_index).isSelected = True
+            material_items.item(default_material_index).isSelected = True
         else:
-            drop_down_input.listItems.add("No materials in current design", True)
+            material_items.add("No materials in current design", True)
             material_check_box.value = False
             material_check_box.isEnabled = False
 
         # Handle Text
-        font_file = os.path.join(os.path.dirname(__file__), 'resources', 'fonts.txt')
-        self.font_list = open(font_file).read().splitlines()
+        self.font_list = get_fonts()
 
         command_inputs.addBoolValueInput("import_text", "Import Text?", True, "", preferences["IMPORT_TEXT"])
         drop_down_fonts = command_inputs.addDropDownCommandInput(
             "font_selection", "Font: ", adsk.core.DropDownStyles.TextListDropDownStyle
         )
+        font_items = drop_down_fonts.listItems
         preselect = 0
         for i, font_item in enumerate(self.font_list):
-            drop_down_fonts.listItems.add(font_item, False)
+            font_items.add(font_item, False)
             if default_font in font_item:
                 preselect = i
-        drop_down_fonts.listItems.item(preselect).isSelected = True
+        font_items.item(preselect).isSelected = True
 
         # Close Sketches
         command_inputs.addBoolValueInput(
@@ -640,7 +663,7 @@ class CloseGapsCommand(apper.Fusion360CommandBase):
     def __init__(self, name: str, options: dict):
         super().__init__(name, options)
         if not bool(self.fusion_app.preferences):
-            file_name = os.path.join(config.app_path, "default_preferences.json")
+            file_name = config.default_preferences_file
             default_preferences = self.fusion_app.read_json_file(file_name)
             self.fusion_app.initialize_preferences(default_preferences)
 
@@ -27,62 +27,80 @@ import adsk.core
 import adsk.fusion
 
 from ..apper import apper
-from .. import config
-
-DxfToFusionUnits = {
-    1: "in",
-    2: "ft",
-    4: "mm",
-    5: "cm",
-    6: "m",
-}
-
-AllDxfUnits = {
-    0: "Unitless",
-    1: "Inches",
-    2: "Feet",
-    3: "Miles",
-    4: "Millimeters",
-    5: "Centimeters",
-    6: "Meters",
-    7: "Kilometers",
-    8: "Microinches",
-    9: "Mils",
-    10: "Yards",
-    11: "Angstroms",
-    12: "Nanometers",
-    13: "Microns",
-    14: "Decimeters",
-    15: "Decameters",
-    16: "Hectometers",
-    17: "Gigameters",
-    18: "Astronomical units",
-    19: "Light years",
-    20: "Parsecs",
-    21: "US Survey Feet",
-    22: "US Survey Inch",
-    23: "US Survey Yard",
-    24: "US Survey Mile",
-}
-
-
-def create_sketch_text(sketch: adsk.fusion.Sketch, dxf_text_entity, font_selection, doc_units):
-    ao = apper.AppObjects()
-    dxf_height = dxf_text_entity.dxf.height
-    height = ao.units_manager.convert(dxf_height, doc_units, ao.units_manager.internalUnits)
-    (align, p1, p2) = dxf_text_entity.get_pos()
-    x = p1[0]
-    y = p1[1]
+
+_create_point = adsk.core.Point3D.create
+
+# Read buffer for DXF files, large files take far fewer reads than with the 8 KiB default
+READ_BUFFER_SIZE = 1 << 20
+
+# Indexed by the DXF $INSUNITS value, None where Fusion has no matching unit
+DxfToFusionUnits = (
+    None,  # 0: Unitless
+    "in",
+    "ft",
+    None,  # 3: Miles
+    "mm",
+    "cm",
+    "m",
+)
+
+# Indexed by the DXF $INSUNITS value
+AllDxfUnits = (
+    "Unitless",
+    "Inches",
+    "Feet",
+    "Miles",
+    "Millimeters",
+    "Centimeters",
+    "Meters",
+    "Kilometers",
+    "Microinches",
+    "Mils",
+    "Yards",
+    "Angstroms",
+    "Nanometers",
+    "Microns",
+    "Decimeters",
+    "Decameters",
+    "Hectometers",
+    "Gigameters",
+    "Astronomical units",
+    "Light years",
+    "Parsecs",
+    "US Survey Feet",
+    "US Survey Inch",
+    "US Survey Yard",
+    "US Survey Mile",
+)
+
+
+def lookup_units(units_table, dxf_units):
+    if 0 <= dxf_units < len(units_table):
+        return units_table[dxf_units]
+    return None
+
+
+def create_sketch_text(sketch: adsk.fusion.Sketch, dxf_text_entity, font_selection, doc_units,
+                       units_manager: adsk.core.UnitsManager, internal_units: str, to_sketch_space=True):
+    # Read all of the DXF attributes through one namespace lookup
+    dxf_attribs = dxf_text_entity.dxf
+    dxf_height = dxf_attribs.height
+    height = units_manager.convert(dxf_height, doc_units, internal_units)
+    align, insert_point, _ = dxf_text_entity.get_pos()
     # ao.ui.messageBox('Align: ' + align)
 
-    dxf_point = adsk.core.Point3D.create(x, y, 0.0)
+    # The only Point3D created per text when the sketch is in model space
+    dxf_point = _create_point(insert_point[0], insert_point[1], 0.0)
 
     # If sketch is created on model face, need to do some transform gymnastics
-    point = sketch.modelToSketchSpace(dxf_point)
-    point.z = 0.0
+    if to_sketch_space:
+        point = sketch.modelToSketchSpace(dxf_point)
+        point.z = 0.0
+    else:
+        point = dxf_point
 
     # Read text from DXF entity
-    text = dxf_text_entity.dxf.text
+    text = dxf_attribs.text
 
     # Get sketch texts
     sketch_texts = sketch.sketchTexts
@@ -95,8 +113,9 @@ def create_sketch_text(sketch: adsk.fusion.Sketch, dxf_text_entity, font_selecti
     # sketch_text_input.textStyle = adsk.fusion.TextStyles.TextStyleBold
 
     # Set sketch text rotation
-    if dxf_text_entity.dxf.rotation:
-        sketch_text_input.angle = ao.units_manager.convert(dxf_text_entity.dxf.rotation, 'deg', 'rad')
+    rotation = dxf_attribs.rotation
+    if rotation:
+        sketch_text_input.angle = units_manager.convert(rotation, 'deg', 'rad')
     else:
         sketch_text_input.angle = 0.0
 
@@ -107,46 +126,78 @@ def create_sketch_text(sketch: adsk.fusion.Sketch, dxf_text_entity, font_selecti
     sketch_texts.add(sketch_text_input)
 
 
-@apper.lib_import(config.app_path)
-def import_dxf_text(file_name, sketch, font_selection, logger: logging.Logger):
-    import ezdxf
-    from ezdxf.entities.text import Text
-    doc = ezdxf.readfile(file_name)
-    msp = doc.modelspace()
+# Fusion units for the DXF $INSUNITS value, falls back to the document units with a logged warning
+def get_doc_units(file_name, dxf_units, logger: logging.Logger):
+    if dxf_units is not None:
+        doc_units = lookup_units(DxfToFusionUnits, dxf_units)
+        if doc_units is not None:
+            return doc_units
 
-    dxf_units = doc.header.get('$INSUNITS', None)
-    if dxf_units is None:
-        app = adsk.core.Application.get()
-        doc_units = app.activeProduct.unitsManager.defaultLengthUnits
-        logger.warning(f'The file: {file_name} did not specify units.')
-        logger.warning(f'Default documents units ({doc_units}) are being assumed for text import.')
-        logger.warning(f'This will likely cause scaling errors with your text and will need to be corrected.')
+    app = adsk.core.Application.get()
+    doc_units = app.activeProduct.unitsManager.defaultLengthUnits
 
+    effect = 'will likely'
+    if dxf_units is None:
+        problem = 'did not specify units'
     else:
-        doc_units = DxfToFusionUnits.get(dxf_units, None)
+        unsupported_units = lookup_units(AllDxfUnits, dxf_units)
+        if unsupported_units is not None:
+            problem = f'specifies unsupported units: ({unsupported_units})'
+            effect = 'could'
+        else:
+            problem = 'specifies invalid units'
+
+    logger.warning(f'The file: {file_name} {problem}.')
+    logger.warning(f'Default documents units ({doc_units}) are being assumed for text import.')
+    logger.warning(f'This {effect} cause scaling errors with your text and will need to be corrected.')
+
+    return doc_units
 
-        if doc_units is None:
-            app = adsk.core.Application.get()
-            doc_units = app.activeProduct.unitsManager.defaultLengthUnits
 
-            unsupported_units = AllDxfUnits.get(dxf_units, None)
-            if unsupported_units is not None:
-                logger.warning(f'The file: {file_name} specifies unsupported units: ({unsupported_units}).')
-                logger.warning(f'Default documents units ({doc_units}) are being assumed for text import.')
-                logger.warning(f'This could cause scaling errors with your text and will need to be corrected.')
+# Same as ezdxf.readfile() but ASCII files are read through a larger buffer
+def read_dxf(file_name):
+    import ezdxf
+    from ezdxf.filemanagement import dxf_file_info
+    from ezdxf.lldxf.validator import is_binary_dxf_file
+
+    if is_binary_dxf_file(file_name) or not ezdxf.is_dxf_file(file_name):
+        return ezdxf.readfile(file_name)
+
+    info = dxf_file_info(file_name)
+    with open(file_name, mode='rt', encoding=info.encoding, errors='ignore', buffering=READ_BUFFER_SIZE) as fp:
+        doc = ezdxf.read(fp)
+    doc.filename = file_name
+    return doc
+
+
+def import_dxf_text(file_name, sketch, font_selection, logger: logging.Logger):
+    from ezdxf.entities.text import Text
+    doc = read_dxf(file_name)
+    msp = doc.modelspace()
+
+    doc_units = get_doc_units(file_name, doc.header.get('$INSUNITS', None), logger)
 
-            else:
-                logger.warning(f'The file: {file_name} specifies invalid units.')
-                logger.warning(f'Default documents units ({doc_units}) are being assumed for text import.')
-                logger.warning(f'This will likely cause scaling errors with your text and will need to be corrected.')
+    # Resolved once for all of the text in the file
+    units_manager = apper.AppObjects().units_manager
+    internal_units = units_manager.internalUnits
+    # Sketches on the XY plane share model space, their points need no transform
+    to_sketch_space = not sketch.transform.isEqualTo(adsk.core.Matrix3D.create())
 
-    # entity query for all TEXT entities in model space
     dxf_text_entity: Text
-    for dxf_text_entity in msp.query('TEXT'):
-        # DEBUG
-        # ao.ui.messageBox('Text: ' + dxf_text_entity.dxf.text)
-        # ao.ui.messageBox('Style: ' + dxf_text_entity.dxf.style)
-        # ao.ui.messageBox('Rotation: ' + str(dxf_text_entity.dxf.rotation))
-
-        if isinstance(dxf_text_entity, Text):
-            create_sketch_text(sketch, dxf_text_entity, font_selection, doc_units)
+    # Compute the sketch once after all of the text is added
+    sketch.isComputeDeferred = True
+    try:
+        # All TEXT entities in model space, dxftype() already guarantees the type
+        for dxf_text_entity in msp:
+            if dxf_text_entity.dxftype() != 'TEXT':
+                continue
+            # DEBUG
+            # ao.ui.messageBox('Text: ' + dxf_text_entity.dxf.text)
+            # ao.ui.messageBox('Style: ' + dxf_text_entity.dxf.style)
+            # ao.ui.messageBox('Rotation: ' + str(dxf_text_entity.dxf.rotation))
+
+            create_sketch_text(
+                sketch, dxf_text_entity, font_selection, doc_units, units_manager, internal_units, to_sketch_space
+            )
+    finally:
+        sketch.isComputeDeferred = False
@@ -1,5 +1,43 @@
-from os.path import dirname, abspath
+from os.path import dirname, abspath, join
 app_path = dirname(abspath(__file__))
 
+# Paths within the add-in, joined once
+lib_path = join(app_path, 'lib')
+resources_path = join(app_path, 'commands', 'resources')
+help_file = join(app_path, 'HelpFile.html')
+default_preferences_file = join(app_path, 'default_preferences.json')
+tooltips_file = join(resources_path, 'tooltips.json')
+fonts_file = join(resources_path, 'fonts.txt')
+
 app_name = 'DXFImporter'
 company_name = "Autodesk"
+
+# Placement shared by all of the add-in's commands
+toolbar_options = {
+    'workspace': 'FusionSolidEnvironment',
+    'toolbar_panel_id': 'DXF Import',
+    'toolbar_tab_name': 'TOOLS',
+    'toolbar_tab_id': 'ToolsTab',
+    'cmd_resources': 'command_icons',
+    'command_visible': True,
+}
+
+import_command_options = {
+    **toolbar_options,
+    'cmd_description': 'Import multiple DXF Files',
+    'cmd_id': 'dxf_import_cmd',
+    'command_promoted': True,
+}
+
+gaps_command_options = {
+    **toolbar_options,
+    'cmd_description': 'Close any gaps within tolerance in a Sketch (Like from an imported DXF File)',
+    'cmd_id': 'dxf_gap_cmd',
+    'command_promoted': False,
+}
+
+# Commands registered with the add-in: (title, command class name, options)
+addin_commands = (
+    ('DXF Bulk Import', 'DXFImportCommand', import_command_options),
+    ('Close Sketch Gaps', 'CloseGapsCommand', gaps_command_options),
+)
@@ -2,14 +2,14 @@
 # License: MIT License
 # Created 2019-02-22
 import math
-from typing import TYPE_CHECKING, Optional, Union, Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union, Iterable, Callable
 
-from ezdxf.math import Vector
+from ezdxf.math import Vector, NULLVEC, Z_AXIS
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass, XType
 from ezdxf.lldxf.const import DXF12, SUBCLASS_MARKER, DXF2010, DXF2000, DXF2007, DXF2004
 from ezdxf.lldxf.const import DXFInternalEzdxfError, DXFValueError, DXFTableEntryError, DXFTypeError
 from ezdxf.lldxf.types import get_xcode_for
-from ezdxf.tools import take2
 from ezdxf.render.arrows import ARROWS
 from .dxfentity import base_class, SubclassProcessor
 from .dxfgfx import DXFGraphic, acdb_entity
@@ -31,13 +31,13 @@ acdb_dimension = DefSubclass('AcDbDimension', {
     'dimstyle': DXFAttr(3, default='Standard'),  # dimension style name
     # The dimension style is stored in doc.sections.tables.dimstyles,
     # shortcut Drawings.dimstyles property
-    'defpoint': DXFAttr(10, xtype=XType.point3d, default=Vector(0, 0, 0)),
+    'defpoint': DXFAttr(10, xtype=XType.point3d, default=NULLVEC),
     # definition point for all dimension types in WCS
     'text_midpoint': DXFAttr(11, xtype=XType.point3d),  # midpoint of dimension text in OCS
 
     # Insertion point for clones of a  dimension—Baseline and Continue (in OCS)
     # located in AcDbDimension? Another error in the DXF reference?
-    'insert': DXFAttr(12, xtype=XType.point3d, default=Vector(0, 0, 0), optional=True),
+    'insert': DXFAttr(12, xtype=XType.point3d, default=NULLVEC, optional=True),
 
     'dimtype': DXFAttr(70, default=0),  # Dimension type:
     # Values 0–6 are integer values that represent the dimension type.
@@ -92,23 +92,23 @@ acdb_dimension = DefSubclass('AcDbDimension', {
     # indicates the horizontal direction for the dimension entity. The dimension entity determines the orientation of
     # dimension text and lines for horizontal, vertical, and rotated linear dimensions. This group value is the negative
     # of the angle between the OCS X axis and the UCS X axis. It is always in the XY plane of the OCS
-    'extrusion': DXFAttr(210, xtype=XType.point3d, default=Vector(0, 0, 1), optional=True),
+    'extrusion': DXFAttr(210, xtype=XType.point3d, default=Z_AXIS, optional=True),
 })
 
 acdb_dimension_dummy = DefSubclass('AcDbDimensionDummy', {
-    'defpoint2': DXFAttr(13, xtype=XType.point3d, default=Vector(0, 0, 0)),
+    'defpoint2': DXFAttr(13, xtype=XType.point3d, default=NULLVEC),
     # Definition point for linear and angular dimensions (in WCS)
-    'defpoint3': DXFAttr(14, xtype=XType.point3d, default=Vector(0, 0, 0)),
+    'defpoint3': DXFAttr(14, xtype=XType.point3d, default=NULLVEC),
     # Definition point for linear and angular dimensions (in WCS)
     # The defpoint2 (13,23,33) specifies the start point of the first extension line and
     # the defpoint3 (14,24,34) specifies the start point of the second extension line.
     # Defpoint (10,20,30) specifies the dimension line location. The text_midpoint (11,21,31)
     # specifies the midpoint of the dimension text.
     'angle': DXFAttr(50, default=0),  # Angle of rotated, horizontal, or vertical dimensions
-    'defpoint4': DXFAttr(15, xtype=XType.point3d, default=Vector(0, 0, 0)),
+    'defpoint4': DXFAttr(15, xtype=XType.point3d, default=NULLVEC),
     # Definition point for diameter, radius, and angular dimensions (in WCS)
     'leader_length': DXFAttr(40),  # Leader length for radius and diameter dimensions
-    'defpoint5': DXFAttr(16, xtype=XType.point3d, default=Vector(0, 0, 0)),
+    'defpoint5': DXFAttr(16, xtype=XType.point3d, default=NULLVEC),
     # Point defining dimension arc for angular dimensions (in OCS)
     # The defpoint2 (13,23,33) and defpoint3 (14,24,34) specify the endpoints of the line used to determine the first
     # extension line. Defpoint (10,20,30) and defpoint4 (15,25,35) specify the endpoints of the line used to determine
@@ -117,15 +117,53 @@ acdb_dimension_dummy = DefSubclass('AcDbDimensionDummy', {
 })
 
 
+# DIMSTYLE attributes which reference arrow blocks and line types by name
+_ARROW_ATTRS = ('dimblk', 'dimblk1', 'dimblk2', 'dimldrblk')
+_LTYPE_ATTRS = ('dimltype', 'dimltex1', 'dimltex2')
+# (name attribute, handle attribute) pairs for DXF R2000+ handle translation
+_ARROW_HANDLE_KEYS = tuple((name, name + '_handle') for name in _ARROW_ATTRS)
+_LTYPE_HANDLE_KEYS = tuple((name, name + '_handle') for name in _LTYPE_ATTRS)
+_MISSING = object()  # marker for absent dict keys, None may be a valid value
+
+# DIMENSION attributes transformed by transform_to_wcs()
+_DIM_OCS_POINTS = ('text_midpoint', 'defpoint5', 'insert')
+_DIM_OCS_ANGLES = ('text_rotation', 'horizontal_direction', 'angle')
+_DIM_WCS_POINTS = ('defpoint', 'defpoint2', 'defpoint3', 'defpoint4')
+
+# DIMENSION attributes exported by export_entity()
+_DXF12_ATTRS = (
+    'geometry', 'dimstyle', 'defpoint', 'text_midpoint', 'insert', 'dimtype', 'text', 'defpoint2',
+    'defpoint3', 'defpoint4', 'defpoint5', 'leader_length', 'angle', 'horizontal_direction',
+    'oblique_angle', 'text_rotation'
+)
+_DXF2000_COMMON_ATTRS = (
+    'version', 'geometry', 'dimstyle', 'defpoint', 'text_midpoint', 'insert', 'dimtype', 'attachment_point',
+    'line_spacing_style', 'line_spacing_factor', 'actual_measurement', 'unknown1', 'flip_arrow_1',
+    'flip_arrow_2', 'text', 'oblique_angle', 'text_rotation', 'horizontal_direction', 'extrusion',
+)
+
+# dimtype: (subclass marker, DXF attributes, empty but required subclass marker)
+_DIM_SUBCLASS_ATTRS = {
+    0: ('AcDbAlignedDimension', ('defpoint2', 'defpoint3', 'angle'), 'AcDbRotatedDimension'),  # linear
+    1: ('AcDbAlignedDimension', ('defpoint2', 'defpoint3', 'angle'), None),  # aligned
+    2: ('AcDb2LineAngularDimension', ('defpoint2', 'defpoint3', 'defpoint4', 'defpoint5'), None),  # angular
+    3: ('AcDbDiametricDimension', ('defpoint4', 'leader_length'), None),  # diameter
+    4: ('AcDbRadialDimension', ('defpoint4', 'leader_length'), None),  # radius
+    5: ('AcDb3PointAngularDimension', ('defpoint2', 'defpoint3', 'defpoint4', 'defpoint5'), None),  # angular3p
+    6: ('AcDbOrdinateDimension', ('defpoint2', 'defpoint3'), None),  # ordinate
+}
+
+
 class OverrideMixin:
     def get_dim_style(self) -> 'DimStyle':
         """ Returns the associated :class:`DimStyle` entity. """
-        if self.doc is None:
+        doc = self.doc
+        if doc is None:
             raise DXFInternalEzdxfError('Dimension.drawing attribute not initialized.')
 
         dim_style_name = self.dxf.dimstyle
         # raises ValueError if not exists, but all used dim styles should exists!
-        return self.doc.dimstyles.get(dim_style_name)
+        return doc.dimstyles.get(dim_style_name)
 
     def dim_style_attributes(self) -> 'DXFAttributes':
         """ Returns all valid DXF attributes (internal API). """
@@ -151,10 +189,11 @@ class OverrideMixin:
 
         """
         data = dict(data)  # shallow copy dict
-        blocks = self.doc.blocks
+        doc = self.doc
+        blocks = doc.blocks
+        linetypes = doc.linetypes
 
-        def set_arrow_handle(attrib_name, block_name):
-            attrib_name += '_handle'
+        def set_arrow_handle(handle_name, block_name):
             if block_name in ARROWS:  # create all arrows on demand
                 block_name = ARROWS.create_block(blocks, block_name)
             if block_name == '_CLOSEDFILLED':  # special arrow
@@ -162,44 +201,35 @@ class OverrideMixin:
             else:
                 block = blocks[block_name]
                 handle = block.block_record_handle
-            data[attrib_name] = handle
+            data[handle_name] = handle
 
-        def set_linetype_handle(attrib_name, linetype_name):
+        def set_linetype_handle(handle_name, linetype_name):
             try:
-                ltype = self.doc.linetypes.get(linetype_name)
+                ltype = linetypes.get(linetype_name)
             except DXFTableEntryError:
-                logger.info('Required line type "{}" does not exist.'.format(linetype_name))
+                logger.info('Required line type "%s" does not exist.', linetype_name)
             else:
-                data[attrib_name + '_handle'] = ltype.dxf.handle
+                data[handle_name] = ltype.dxf.handle
 
         if dxfversion > DXF12:
             # transform block names into block record handles
-            for attrib_name in ('dimblk', 'dimblk1', 'dimblk2', 'dimldrblk'):
-                try:
-                    block_name = data.pop(attrib_name)
-                except KeyError:
-                    pass
-                else:
-                    set_arrow_handle(attrib_name, block_name)
+            for attrib_name, handle_name in _ARROW_HANDLE_KEYS:
+                block_name = data.pop(attrib_name, _MISSING)
+                if block_name is not _MISSING:
+                    set_arrow_handle(handle_name, block_name)
 
             # replace 'dimtxsty' attribute by 'dimtxsty_handle'
-            try:
-                dimtxsty = data.pop('dimtxsty')
-            except KeyError:
-                pass
-            else:
-                txtstyle = self.doc.styles.get(dimtxsty)
+            dimtxsty = data.pop('dimtxsty', _MISSING)
+            if dimtxsty is not _MISSING:
+                txtstyle = doc.styles.get(dimtxsty)
                 data['dimtxsty_handle'] = txtstyle.dxf.handle
 
         if dxfversion >= DXF2007:
             # transform linetype names into LTYPE entry handles
-            for attrib_name in ('dimltype', 'dimltex1', 'dimltex2'):
-                try:
-                    linetype_name = data.pop(attrib_name)
-                except KeyError:
-                    pass
-                else:
-                    set_linetype_handle(attrib_name, linetype_name)
+            for attrib_name, handle_name in _LTYPE_HANDLE_KEYS:
+                linetype_name = data.pop(attrib_name, _MISSING)
+                if linetype_name is not _MISSING:
+                    set_linetype_handle(handle_name, linetype_name)
         return data
 
     def set_acad_dstyle(self, data: dict) -> None:
@@ -210,31 +240,32 @@ class OverrideMixin:
 
         (internal API)
         """
-        if self.doc is None:
+        doc = self.doc
+        if doc is None:
             raise DXFInternalEzdxfError('Dimension.doc attribute not initialized.')
 
         # ezdxf uses internally only resource names for arrows, line types and text styles, but
         # DXF 2000 and later requires handles for these resources
-        actual_dxfversion = self.doc.dxfversion
+        actual_dxfversion = doc.dxfversion
         data = self.dim_style_attr_names_to_handles(data, actual_dxfversion)
         tags = []
-        dim_style_attributes = self.dim_style_attributes()
+        append = tags.append
+        get_dxf_attr = self.dim_style_attributes().get
         for key, value in data.items():
-            if key not in dim_style_attributes:  # ignore unknown attributes, but log
-                logging.debug('Ignore unknown DIMSTYLE attribute: "{}"'.format(key))
+            dxf_attr = get_dxf_attr(key)
+            if dxf_attr is None:  # ignore unknown attributes, but log
+                logger.debug('Ignore unknown DIMSTYLE attribute: "%s"', key)
                 continue
-            dxf_attr = dim_style_attributes.get(key)
-            if dxf_attr and dxf_attr.code > 0:  # skip internal and virtual tags
+            code = dxf_attr.code
+            if code > 0:  # skip internal and virtual tags
                 if dxf_attr.dxfversion > actual_dxfversion:
-                    logging.debug(
-                        'Unsupported DIMSTYLE attribute "{}" for DXF version {}'.format(key, self.doc.acad_release))
+                    logger.debug('Unsupported DIMSTYLE attribute "%s" for DXF version %s', key, doc.acad_release)
                     continue
-                code = dxf_attr.code
-                tags.append((1070, code))
+                append((1070, code))
                 if code == 5:  # DimStyle 'dimblk' has group code 5 but is not a handle
-                    tags.append((1000, value))
+                    append((1000, value))
                 else:
-                    tags.append((get_xcode_for(code), value))
+                    append((get_xcode_for(code), value))
 
         if len(tags):
             self.set_xdata_list('ACAD', 'DSTYLE', tags)
@@ -266,58 +297,39 @@ class OverrideMixin:
             try:
                 block_record = db[handle]
             except KeyError:
-                logger.info(
-                    'Required arrow block #{} does not exist, ignoring {} override.'.format(handle, attrib_name.upper())
-                )
+                logger.info('Required arrow block #%s does not exist, ignoring %s override.',
+                            handle, attrib_name.upper())
                 return
-            name = block_record.dxf.name
-            if name.startswith('_'):  # translate block name into ACAD standard name _OPEN30 -> OPEN30
-                acad_arrow_name = name[1:]
-                if ARROWS.is_acad_arrow(acad_arrow_name):
-                    name = acad_arrow_name
-            data[attrib_name] = name
+            data[attrib_name] = _arrow_name(block_record.dxf.name)
 
         def set_ltype_name(attrib_name: str, handle: str):
             try:
                 ltype = db[handle]
             except KeyError:
-                logger.info(
-                    'Required line type #{} does not exist, ignoring {} override.'.format(handle, attrib_name.upper())
-                )
+                logger.info('Required line type #%s does not exist, ignoring %s override.', handle, attrib_name.upper())
             else:
                 data[attrib_name] = ltype.dxf.name
 
         # transform block record handles into block names
-        for attrib_name in ('dimblk', 'dimblk1', 'dimblk2', 'dimldrblk'):
-            try:
-                blkrec_handle = data.pop(attrib_name + '_handle')
-            except KeyError:
-                pass
-            else:
+        for attrib_name, handle_name in _ARROW_HANDLE_KEYS:
+            blkrec_handle = data.pop(handle_name, _MISSING)
+            if blkrec_handle is not _MISSING:
                 set_arrow_name(attrib_name, blkrec_handle)
 
         # replace 'dimtxsty_handle' attribute by 'dimtxsty_handle'
-        try:
-            dimtxsty_handle = data.pop('dimtxsty_handle')
-        except KeyError:
-            pass
-        else:
+        dimtxsty_handle = data.pop('dimtxsty_handle', _MISSING)
+        if dimtxsty_handle is not _MISSING:
             try:
                 txtstyle = db[dimtxsty_handle]
             except KeyError:
-                logger.info(
-                    'Required text style #{} does not exist, ignoring DIMTXSTY override.'.format(dimtxsty_handle)
-                )
+                logger.info('Required text style #%s does not exist, ignoring DIMTXSTY override.', dimtxsty_handle)
             else:
                 data['dimtxsty'] = txtstyle.dxf.name
 
         # transform linetype handles into LTYPE entry names
-        for attrib_name in ('dimltype', 'dimltex1', 'dimltex2'):
-            try:
-                handle = data.pop(attrib_name + '_handle')
-            except KeyError:
-                pass
-            else:
+        for attrib_name, handle_name in _LTYPE_HANDLE_KEYS:
+            handle = data.pop(handle_name, _MISSING)
+            if handle is not _MISSING:
                 set_ltype_name(attrib_name, handle)
         return data
 
@@ -332,12 +344,12 @@ class OverrideMixin:
         except DXFValueError:
             return {}
         attribs = {}
-        codes = dim_style.CODE_TO_DXF_ATTRIB
-        for code_tag, value_tag in take2(data):
-            group_code = code_tag.value
-            value = value_tag.value
-            if group_code in codes:
-                attribs[codes[group_code]] = value
+        get_attrib_name = dim_style.CODE_TO_DXF_ATTRIB.get
+        tags = iter(data)
+        for code_tag, value_tag in zip(tags, tags):  # same as take2(data) without the generator overhead
+            attrib_name = get_attrib_name(code_tag.value)
+            if attrib_name is not None:
+                attribs[attrib_name] = value_tag.value
         return self.dim_style_attr_handles_to_names(attribs)
 
 
@@ -364,12 +376,14 @@ class Dimension(DXFGraphic, OverrideMixin):
     def load_dxf_attribs(self, processor: SubclassProcessor = None) -> 'DXFNamespace':
         dxf = super().load_dxf_attribs(processor)
         if processor:
+            # R12 has always unprocessed tags, see SubclassProcessor.load_dxfattribs_into_namespace()
+            log_tags = not processor.r12
             tags = processor.load_dxfattribs_into_namespace(dxf, acdb_dimension)
-            if len(tags) and not processor.r12:
+            if tags and log_tags:
                 processor.log_unprocessed_tags(tags, subclass=acdb_dimension.name)
             tags = processor.load_dxfattribs_into_namespace(dxf, acdb_dimension_dummy, index=3)
             # ignore possible 5. subclass AcDbRotatedDimension, has no content
-            if len(tags) and not processor.r12:
+            if tags and log_tags:
                 processor.log_unprocessed_tags(tags, subclass=acdb_dimension_dummy.name)
 
         return dxf
@@ -379,46 +393,25 @@ class Dimension(DXFGraphic, OverrideMixin):
         # base class export is done by parent class
         super().export_entity(tagwriter)
         # AcDbEntity export is done by parent class
+        dxf = self.dxf
+        export = dxf.export_dxf_attribs
         if tagwriter.dxfversion == DXF12:
-            self.dxf.export_dxf_attribs(tagwriter, [
-                'geometry', 'dimstyle', 'defpoint', 'text_midpoint', 'insert', 'dimtype', 'text', 'defpoint2',
-                'defpoint3', 'defpoint4', 'defpoint5', 'leader_length', 'angle', 'horizontal_direction',
-                'oblique_angle', 'text_rotation'
-            ])
+            export(tagwriter, _DXF12_ATTRS)
             return
 
         # else DXF2000+
-        tagwriter.write_tag2(SUBCLASS_MARKER, acdb_dimension.name)
+        write = tagwriter.write_tag2
+        write(SUBCLASS_MARKER, acdb_dimension.name)
         dim_type = self.dimtype
-        self.dxf.export_dxf_attribs(tagwriter, [
-            'version', 'geometry', 'dimstyle', 'defpoint', 'text_midpoint', 'insert', 'dimtype', 'attachment_point',
-            'line_spacing_style', 'line_spacing_factor', 'actual_measurement', 'unknown1', 'flip_arrow_1',
-            'flip_arrow_2', 'text', 'oblique_angle', 'text_rotation', 'horizontal_direction', 'extrusion',
-        ])
-
-        if dim_type == 0:  # linear
-            tagwriter.write_tag2(SUBCLASS_MARKER, 'AcDbAlignedDimension')
-            self.dxf.export_dxf_attribs(tagwriter, ['defpoint2', 'defpoint3', 'angle'])
-            # empty but required subclass
-            tagwriter.write_tag2(SUBCLASS_MARKER, 'AcDbRotatedDimension')
-        elif dim_type == 1:  # aligned
-            tagwriter.write_tag2(SUBCLASS_MARKER, 'AcDbAlignedDimension')
-            self.dxf.export_dxf_attribs(tagwriter, ['defpoint2', 'defpoint3', 'angle'])
-        elif dim_type == 2:  # angular & angular3p
-            tagwriter.write_tag2(SUBCLASS_MARKER, 'AcDb2LineAngularDimension')
-            self.dxf.export_dxf_attribs(tagwriter, ['defpoint2', 'defpoint3', 'defpoint4', 'defpoint5'])
-        elif dim_type == 3:  # diameter
-            tagwriter.write_tag2(SUBCLASS_MARKER, 'AcDbDiametricDimension')
-            self.dxf.export_dxf_attribs(tagwriter, ['defpoint4', 'leader_length'])
-        elif dim_type == 4:  # radius
-            tagwriter.write_tag2(SUBCLASS_MARKER, 'AcDbRadialDimension')
-            self.dxf.export_dxf_attribs(tagwriter, ['defpoint4', 'leader_length'])
-        elif dim_type == 5:  # angular & angular3p
-            tagwriter.write_tag2(SUBCLASS_MARKER, 'AcDb3PointAngularDimension')
-            self.dxf.export_dxf_attribs(tagwriter, ['defpoint2', 'defpoint3', 'defpoint4', 'defpoint5'])
-        elif dim_type == 6:  # ordinate
-            tagwriter.write_tag2(SUBCLASS_MARKER, 'AcDbOrdinateDimension')
-            self.dxf.export_dxf_attribs(tagwriter, ['defpoint2', 'defpoint3'])
+        export(tagwriter, _DXF2000_COMMON_ATTRS)
+
+        subclass = _DIM_SUBCLASS_ATTRS.get(dim_type)
+        if subclass is not None:
+            marker, attribs, extra_marker = subclass
+            write(SUBCLASS_MARKER, marker)
+            export(tagwriter, attribs)
+            if extra_marker:  # empty but required subclass
+                write(SUBCLASS_MARKER, extra_marker)
 
     @property
     def dimtype(self) -> int:
@@ -451,43 +444,13 @@ class Dimension(DXFGraphic, OverrideMixin):
 
         """
 
-        def angle_between(v1: Vector, v2: Vector) -> float:
-            angle = v2.angle_deg - v1.angle_deg
-            return angle + 360 if angle < 0 else angle
-
-        if self.dimtype in (0, 1):  # linear, aligned
-            return linear_measurement(
-                self.dxf.defpoint2,
-                self.dxf.defpoint3,
-                math.radians(self.dxf.get('angle', 0)),
-                self.ocs(),
-            )
-        elif self.dimtype in (3, 4):  # diameter, radius
-            p1 = Vector(self.dxf.defpoint)
-            p2 = Vector(self.dxf.defpoint4)
-            return (p2 - p1).magnitude
-        elif self.dimtype == 2:  # angular from 2 lines
-            p1 = Vector(self.dxf.defpoint2)  # 1. point of 1. extension line
-            p2 = Vector(self.dxf.defpoint3)  # 2. point of 1. extension line
-            p3 = Vector(self.dxf.defpoint4)  # 1. point of 2. extension line
-            p4 = Vector(self.dxf.defpoint)  # 2. point of 2. extension line
-            dir1 = p2 - p1  # direction of 1. extension line
-            dir2 = p4 - p3  # direction of 2. extension line
-            return angle_between(dir1, dir2)
-        elif self.dimtype == 5:  # angular from 2 lines
-            p1 = Vector(self.dxf.defpoint4)  # center
-            p2 = Vector(self.dxf.defpoint2)  # 1. extension line
-            p3 = Vector(self.dxf.defpoint3)  # 2. extension line
-            dir1 = p2 - p1  # direction of 1. extension line
-            dir2 = p3 - p1  # direction of 2. extension line
-            return angle_between(dir1, dir2)
-        elif self.dimtype == 6:  # ordinate
-            origin = Vector(self.dxf.defpoint)
-            feature_location = Vector(self.dxf.defpoint2)
-            return feature_location - origin
-        else:
-            logger.debug("get_measurement() - unknown DIMENSION type {}.".format(self.dimtype))
+        dxf = self.dxf
+        dim_type = self.dimtype
+        handler = _MEASUREMENT_HANDLERS.get(dim_type)
+        if handler is None:
+            logger.debug("get_measurement() - unknown DIMENSION type %s.", dim_type)
             return 0
+        return handler(dxf, self.ocs)
 
     def override(self) -> 'DimStyleOverride':
         """ Returns the :class:`~ezdxf.entities.DimStyleOverride` object.
@@ -516,18 +479,12 @@ class Dimension(DXFGraphic, OverrideMixin):
         """
         # Transform existing OCS points and angles
         dxf = self.dxf
-        vector_names = [
-            name for name in ['text_midpoint', 'defpoint5', 'insert'] if dxf.hasattr(name)
-        ]
-        angle_names = [
-            name for name in ['text_rotation', 'horizontal_direction', 'angle'] if dxf.hasattr(name)
-        ]
+        vector_names = [name for name in _DIM_OCS_POINTS if dxf.hasattr(name)]
+        angle_names = [name for name in _DIM_OCS_ANGLES if dxf.hasattr(name)]
         self._ucs_and_ocs_transformation(ucs, vector_names=vector_names, angle_names=angle_names)
 
         # Transform existing WCS points
-        for name in ['defpoint', 'defpoint2', 'defpoint3', 'defpoint4']:
-            if dxf.hasattr(name):
-                dxf.set(name, ucs.to_wcs(dxf.get(name)))
+        _transform_wcs_points(dxf, _DIM_WCS_POINTS, ucs)
         return self
 
     def virtual_entities(self) -> Iterable['DXFGraphic']:
@@ -565,17 +522,22 @@ class Dimension(DXFGraphic, OverrideMixin):
 
 
 acdb_arc_dimension = DefSubclass('AcDbArcDimension', {
-    'ext_line1_point': DXFAttr(13, xtype=XType.point3d, default=Vector(0, 0, 0)),
-    'ext_line2_point': DXFAttr(14, xtype=XType.point3d, default=Vector(0, 0, 0)),
-    'arc_center': DXFAttr(15, xtype=XType.point3d, default=Vector(0, 0, 0)),
+    'ext_line1_point': DXFAttr(13, xtype=XType.point3d, default=NULLVEC),
+    'ext_line2_point': DXFAttr(14, xtype=XType.point3d, default=NULLVEC),
+    'arc_center': DXFAttr(15, xtype=XType.point3d, default=NULLVEC),
     'start_angle': DXFAttr(40),  # radians?
     'end_angle': DXFAttr(41),  # radians?
     'is_partial': DXFAttr(70),
     'has_leader': DXFAttr(71),
-    'leader_point1': DXFAttr(16, xtype=XType.point3d, default=Vector(0, 0, 0)),
-    'leader_point2': DXFAttr(17, xtype=XType.point3d, default=Vector(0, 0, 0)),
+    'leader_point1': DXFAttr(16, xtype=XType.point3d, default=NULLVEC),
+    'leader_point2': DXFAttr(17, xtype=XType.point3d, default=NULLVEC),
 })
 
+_ARC_DIM_ATTRS = (
+    'ext_line1_point', 'ext_line2_point', 'arc_center', 'start_angle', 'end_angle',
+    'is_partial', 'has_leader', 'leader_point1', 'leader_point2',
+)
+
 
 @register_entity
 class ArcDimension(Dimension):
@@ -588,11 +550,12 @@ class ArcDimension(Dimension):
         # skip Dimension loader
         dxf = super(Dimension, self).load_dxf_attribs(processor)
         if processor:
+            log_tags = not processor.r12
             tags = processor.load_dxfattribs_into_namespace(dxf, acdb_dimension)
-            if len(tags) and not processor.r12:
+            if tags and log_tags:
                 processor.log_unprocessed_tags(tags, subclass=acdb_dimension.name)
             tags = processor.load_dxfattribs_into_namespace(dxf, acdb_arc_dimension, index=3)
-            if len(tags) and not processor.r12:
+            if tags and log_tags:
                 processor.log_unprocessed_tags(tags, subclass=acdb_arc_dimension.name)
         return dxf
 
@@ -600,18 +563,12 @@ class ArcDimension(Dimension):
         """ Export entity specific data as DXF tags. """
         super().export_entity(tagwriter)
         tagwriter.write_tag2(SUBCLASS_MARKER, 'AcDbArcDimension')
-        self.dxf.export_dxf_attribs(tagwriter, [
-            'ext_line1_point', 'ext_line2_point', 'arc_center', 'start_angle', 'end_angle',
-            'is_partial', 'has_leader', 'leader_point1', 'leader_point2',
-        ])
+        self.dxf.export_dxf_attribs(tagwriter, _ARC_DIM_ATTRS)
 
     def transform_to_wcs(self, ucs: 'UCS') -> 'Dimension':
         super().transform_to_wcs(ucs)
         self._ucs_and_ocs_transformation(ucs, vector_names=[], angle_names=['start_angle', 'end_angle'])
-        dxf = self.dxf
-        for name in ['leader_point1', 'leader_point2']:
-            if dxf.hasattr(name):
-                dxf.set(name, ucs.to_wcs(dxf.get(name)))
+        _transform_wcs_points(self.dxf, ('leader_point1', 'leader_point2'), ucs)
         return self
 
 
@@ -656,19 +613,78 @@ acdb_dim_assoc = DefSubclass('AcDbDimAssoc', {
 })
 
 
+@lru_cache(maxsize=64)
+def _arrow_name(block_name: str) -> str:
+    """ Translate arrow block name into ACAD standard name _OPEN30 -> OPEN30, other block names are unchanged. """
+    if block_name.startswith('_'):
+        acad_arrow_name = block_name[1:]
+        if ARROWS.is_acad_arrow(acad_arrow_name):
+            return acad_arrow_name
+    return block_name
+
+
+def _transform_wcs_points(dxf: 'DXFNamespace', names: Iterable[str], ucs: 'UCS') -> None:
+    """ Transform existing WCS point attributes `names` from `ucs` to WCS. """
+    # dxf.get() raises DXFAttributeError for unsupported attributes like 'defpoint2' of ARC_DIMENSION
+    names = [name for name in names if dxf.hasattr(name)]
+    if names:
+        # transform all points by one points_to_wcs() call
+        points = ucs.points_to_wcs(dxf.get(name) for name in names)
+        for name, point in zip(names, points):
+            dxf.set(name, point)
+
+
+def _angle_between(v1: Vector, v2: Vector) -> float:
+    angle = v2.angle_deg - v1.angle_deg
+    return angle + 360 if angle < 0 else angle
+
+
+# Measurement handlers for Dimension.get_measurement(), called with the DXF namespace and the OCS getter,
+# the OCS is only required for linear dimensions.
+
+def _linear_measurement(dxf: 'DXFNamespace', ocs: Callable[[], 'OCS']) -> float:  # linear, aligned
+    return linear_measurement(dxf.defpoint2, dxf.defpoint3, math.radians(dxf.get('angle', 0)), ocs())
+
+
+def _radial_measurement(dxf: 'DXFNamespace', ocs: Callable[[], 'OCS']) -> float:  # diameter, radius
+    return (dxf.defpoint4 - dxf.defpoint).magnitude
+
+
+def _angular_2l_measurement(dxf: 'DXFNamespace', ocs: Callable[[], 'OCS']) -> float:  # angular from 2 lines
+    # 1. extension line: defpoint2 -> defpoint3, 2. extension line: defpoint4 -> defpoint
+    return _angle_between(dxf.defpoint3 - dxf.defpoint2, dxf.defpoint - dxf.defpoint4)
+
+
+def _angular_3p_measurement(dxf: 'DXFNamespace', ocs: Callable[[], 'OCS']) -> float:  # angular from 3 points
+    center = dxf.defpoint4
+    return _angle_between(dxf.defpoint2 - center, dxf.defpoint3 - center)
+
+
+def _ordinate_measurement(dxf: 'DXFNamespace', ocs: Callable[[], 'OCS']) -> Vector:
+    # vector from origin to feature location
+    return dxf.defpoint2 - dxf.defpoint
+
+
+_MEASUREMENT_HANDLERS = {
+    0: _linear_measurement,
+    1: _linear_measurement,
+    2: _angular_2l_measurement,
+    3: _radial_measurement,
+    4: _radial_measurement,
+    5: _angular_3p_measurement,
+    6: _ordinate_measurement,
+}
+
+
 def linear_measurement(p1: Vector, p2: Vector, angle: float = 0, ocs: 'OCS' = None) -> float:
     """ Returns distance from `p1` to `p2` projected onto ray defined by `angle`, `angle` in radians in the xy-plane.
     """
+    # projection onto a unit vector is linear: project only the difference p2 - p1
+    delta = Vector(p2) - p1
+    # angle in OCS or WCS xy-plane
+    measurement_direction = Vector.from_angle(angle)
     if ocs is not None and ocs.uz != (0, 0, 1):
-        p1 = ocs.to_wcs(p1)
-        p2 = ocs.to_wcs(p2)
-        # angle in OCS xy-plane
-        ocs_direction = Vector.from_angle(angle)
-        measurement_direction = ocs.to_wcs(ocs_direction)
-    else:
-        # angle in WCS xy-plane
-        measurement_direction = Vector.from_angle(angle)
-
-    t1 = measurement_direction.project(p1)
-    t2 = measurement_direction.project(p2)
-    return (t2 - t1).magnitude
+        # OCS is a pure rotation, transform the difference vector and the direction into WCS
+        delta = ocs.to_wcs(delta)
+        measurement_direction = ocs.to_wcs(measurement_direction)
+    return abs(measurement_direction.dot(delta))
@@ -3,6 +3,7 @@
 # Created 2019-02-13
 #
 # DXFGraphic - graphical DXF entities stored in ENTITIES and BLOCKS sections
+from sys import intern
 from typing import TYPE_CHECKING, Optional, Tuple, Iterable, Callable, Dict
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import DXF12, DXF2000, DXF2004, DXF2007, DXF2013, DXFValueError, DXFKeyError, DXFTableEntryError
@@ -10,7 +11,7 @@ from ezdxf.lldxf.const import SUBCLASS_MARKER, DXFInvalidLayerName, DXFInvalidLi
 from ezdxf.lldxf.const import DXFStructureError
 from ezdxf.lldxf.validator import is_valid_layer_name
 from .dxfentity import DXFEntity, base_class, SubclassProcessor
-from ezdxf.math import OCS, UCS
+from ezdxf.math import OCS, UCS, Z_AXIS
 from ezdxf.tools.rgb import int2rgb, rgb2int
 from ezdxf.tools import float2transparency, transparency2float
 from .factory import register_entity
@@ -22,7 +23,9 @@ if TYPE_CHECKING:
 
 __all__ = ['DXFGraphic', 'acdb_entity', 'entity_linker', 'SeqEnd']
 
-GRAPHIC_PROPERTIES = {'layer', 'linetype', 'color', 'lineweight', 'ltscale', 'true_color', 'color_name', }
+GRAPHIC_PROPERTIES = ('layer', 'linetype', 'color', 'lineweight', 'ltscale', 'true_color', 'color_name')
+INTERNED_ATTRIBS = ('layer', 'linetype')
+HYPERLINK_APPID = 'PE_URL'  # AutoCAD hyperlinks are stored as XDATA of this application
 
 acdb_entity = DefSubclass('AcDbEntity', {
     'layer': DXFAttr(8, default='0'),  # layername as string
@@ -70,6 +73,24 @@ acdb_entity = DefSubclass('AcDbEntity', {
 
 })
 
+ACDB_ENTITY_NAME = acdb_entity.name
+
+# OCS of the default extrusion (0, 0, 1), does no transformation at all
+WCS_OCS = OCS()
+
+# Full control over tag order and YES, sometimes order matters
+ACDB_ENTITY_EXPORT_ORDER = (
+    'paperspace', 'layer', 'linetype', 'material_handle', 'color', 'lineweight', 'ltscale', 'true_color',
+    'color_name', 'transparency', 'plotstyle_enum', 'plotstyle_handle', 'shadow_mode',
+    'visualstyle_handle',
+)
+
+
+def proxy_graphic_length_code(dxfversion: Optional[str]) -> int:
+    """ Returns group code of the proxy graphic length tag for `dxfversion`. (internal API) """
+    # length tag has group code 92 until DXF R2010
+    return 92 if dxfversion and dxfversion < DXF2013 else 160
+
 
 class DXFGraphic(DXFEntity):
     """
@@ -94,39 +115,45 @@ class DXFGraphic(DXFEntity):
 
         # Load proxy graphic data if requested
         if options.load_proxy_graphics:
-            # length tag has group code 92 until DXF R2010
-            if processor.dxfversion and processor.dxfversion < DXF2013:
-                code = 92
-            else:
-                code = 160
             self.proxy_graphic = load_proxy_graphic(
                 processor.subclasses[0 if r12 else 1],
-                length_code=code,
+                length_code=proxy_graphic_length_code(processor.dxfversion),
             )
 
         # Load common AcDbEntity attributes into dxf namespace
         tags = processor.load_dxfattribs_into_namespace(dxf, acdb_entity, index=1)
         if len(tags) and not r12:
             processor.log_unprocessed_tags(tags, subclass=acdb_entity.name)
+
+        # A drawing uses only a few distinct layer and linetype names, share one string object per name
+        # between all loaded entities, the value does not change, so bypassing __setattr__() is safe
+        attribs = dxf.__dict__
+        for key in INTERNED_ATTRIBS:
+            value = attribs.get(key)
+            if value is not None:
+                attribs[key] = intern(value)
         return dxf
 
     def post_new_hook(self):
         """ Post processing and integrity validation after entity creation (internal API) """
         ns = self.dxf
-        if not is_valid_layer_name(ns.layer):
-            raise DXFInvalidLayerName(ns.layer)
+        layer = ns.layer
+        if not is_valid_layer_name(layer):
+            raise DXFInvalidLayerName(layer)
 
-        if ns.hasattr('linetype'):
-            if ns.linetype not in self.doc.linetypes:
-                raise DXFInvalidLineType('Linetype "{}" not defined.'.format(ns.linetype))
+        # existing DXF attributes are stored in the namespace __dict__, new entities rarely set a linetype
+        linetype = ns.__dict__.get('linetype')
+        if linetype is not None and linetype not in self.doc.linetypes:
+            raise DXFInvalidLineType('Linetype "{}" not defined.'.format(linetype))
 
     @property
     def rgb(self) -> Optional[Tuple[int, int, int]]:
         """ Returns RGB true color as (r, g, b) tuple or None if true_color is not set. """
-        if self.dxf.hasattr('true_color'):
-            return int2rgb(self.dxf.get('true_color'))
-        else:
+        # existing DXF attributes are stored in the namespace __dict__, most entities have no true color
+        true_color = self.dxf.__dict__.get('true_color')
+        if true_color is None:
             return None
+        return int2rgb(true_color)
 
     @rgb.setter
     def rgb(self, rgb: Tuple[int, int, int]) -> None:
@@ -136,10 +163,10 @@ class DXFGraphic(DXFEntity):
     @property
     def transparency(self) -> float:
         """ Get transparency as float value between 0 and 1, 0 is opaque and 1 is 100% transparent (invisible). """
-        if self.dxf.hasattr('transparency'):
-            return transparency2float(self.dxf.get('transparency'))
-        else:
+        transparency = self.dxf.__dict__.get('transparency')
+        if transparency is None:
             return 0.
+        return transparency2float(transparency)
 
     @transparency.setter
     def transparency(self, transparency: float) -> None:
@@ -153,11 +180,9 @@ class DXFGraphic(DXFEntity):
         .. versionadded:: 0.12
 
         """
-        attribs = dict()
-        for key in GRAPHIC_PROPERTIES:
-            if self.dxf.hasattr(key):
-                attribs[key] = self.dxf.get(key)
-        return attribs
+        # existing DXF attributes are stored in the namespace __dict__: one lookup instead of hasattr() + get()
+        existing_attribs = self.dxf.__dict__
+        return {key: existing_attribs[key] for key in GRAPHIC_PROPERTIES if key in existing_attribs}
 
     def ocs(self) -> Optional[OCS]:
         """
@@ -167,20 +192,27 @@ class DXFGraphic(DXFEntity):
         """
         # extrusion is only defined for 2D entities like Text, Circle, ...
         if self.dxf.is_supported('extrusion'):
-            extrusion = self.dxf.get('extrusion', default=(0, 0, 1))
+            extrusion = self.dxf.get('extrusion', default=Z_AXIS)
+            # most entities use the default extrusion, they share one OCS without transformation
+            if extrusion is Z_AXIS or extrusion == Z_AXIS:
+                return WCS_OCS
             return OCS(extrusion)
         else:
             return None
 
     def set_owner(self, owner: str, paperspace: int = 0) -> None:
         """ Set owner attribute and paperspace flag. (internal API)"""
-        self.dxf.owner = owner
-        if paperspace:
-            self.dxf.paperspace = paperspace
-        else:
-            self.dxf.discard('paperspace')
-        for e in self.linked_entities():  # type: DXFGraphic
-            e.set_owner(owner, paperspace)
+        # iterative worklist instead of recursive set_owner() calls for linked VERTEX or ATTRIB entities
+        stack = [self]
+        while stack:
+            e = stack.pop()  # type: DXFGraphic
+            dxf = e.dxf
+            dxf.owner = owner
+            if paperspace:
+                dxf.paperspace = paperspace
+            else:
+                dxf.discard('paperspace')
+            stack.extend(e.linked_entities())
 
     def linked_entities(self) -> Iterable['DXFEntity']:
         """ Yield linked entities: VERTEX or ATTRIB, different handling than attached entities. (internal API)"""
@@ -215,21 +247,15 @@ class DXFGraphic(DXFEntity):
 
     def export_acdb_entity(self, tagwriter: 'TagWriter'):
         """ Export subclass 'AcDbEntity' as DXF tags. (internal API)"""
-        # Full control over tag order and YES, sometimes order matters
         not_r12 = tagwriter.dxfversion > DXF12
         if not_r12:
-            tagwriter.write_tag2(SUBCLASS_MARKER, acdb_entity.name)
+            tagwriter.write_tag2(SUBCLASS_MARKER, ACDB_ENTITY_NAME)
 
-        self.dxf.export_dxf_attribs(tagwriter, [
-            'paperspace', 'layer', 'linetype', 'material_handle', 'color', 'lineweight', 'ltscale', 'true_color',
-            'color_name', 'transparency', 'plotstyle_enum', 'plotstyle_handle', 'shadow_mode',
-            'visualstyle_handle',
-        ])
+        self.dxf.export_dxf_attribs(tagwriter, ACDB_ENTITY_EXPORT_ORDER)
 
         if self.proxy_graphic and not_r12 and options.store_proxy_graphics:
-            # length tag has group code 92 until DXF R2010
             export_proxy_graphic(self.proxy_graphic, tagwriter,
-                                 length_code=(92 if tagwriter.dxfversion < DXF2013 else 160))
+                                 length_code=proxy_graphic_length_code(tagwriter.dxfversion))
 
     def get_layout(self) -> Optional['BaseLayout']:
         """ Returns the owner layout or returns ``None`` if entity is not assigned to any layout. """
@@ -302,17 +328,23 @@ class DXFGraphic(DXFEntity):
         Takes established OCS by the extrusion vector :attr:`dxf.extrusion` into account.
 
         """
-        extrusion = self.dxf.extrusion
-        vectors = (self.dxf.get_default(name) for name in vector_names)
-        ocs_vectors = ucs.ocs_points_to_ocs(vectors, extrusion=extrusion)
-        for name, value in zip(vector_names, ocs_vectors):
-            self.dxf.set(name, value)
-        if angle_names is not None:
-            angles = (self.dxf.get_default(name) for name in angle_names)
+        dxf = self.dxf
+        get_default = dxf.get_default
+        set_attrib = dxf.set
+        extrusion = dxf.extrusion
+        if vector_names:
+            # all vectors are transformed by the OCS setup of a single ocs_points_to_ocs() call
+            vectors = (get_default(name) for name in vector_names)
+            ocs_vectors = ucs.ocs_points_to_ocs(vectors, extrusion=extrusion)
+            for name, value in zip(vector_names, ocs_vectors):
+                set_attrib(name, value)
+        if angle_names:
+            # ocs_angles_to_ocs_deg() sets up the source and target OCS even for an empty angle list
+            angles = (get_default(name) for name in angle_names)
             ocs_angles = ucs.ocs_angles_to_ocs_deg(angles=angles, extrusion=extrusion)
             for name, value in zip(angle_names, ocs_angles):
-                self.dxf.set(name, value)
-        self.dxf.extrusion = ucs.direction_to_wcs(extrusion)
+                set_attrib(name, value)
+        dxf.extrusion = ucs.direction_to_wcs(extrusion)
 
     def has_hyperlink(self) -> bool:
         """ Returns ``True`` if entity has an attached hyperlink.
@@ -320,7 +352,9 @@ class DXFGraphic(DXFEntity):
         .. versionadded:: 0.12
 
         """
-        return bool(self.xdata) and ('PE_URL' in self.xdata)
+        # xdata is None for entities without any XDATA, this check avoids XData.__len__()
+        xdata = self.xdata
+        return xdata is not None and HYPERLINK_APPID in xdata
 
     def set_hyperlink(self, link: str, description: str = None, location: str = None):
         """ Set hyperlink of an entity.
@@ -328,18 +362,17 @@ class DXFGraphic(DXFEntity):
         .. versionadded:: 0.12
 
         """
-        xdata = [(1001, 'PE_URL'), (1000, str(link))]
+        xdata = [(1001, HYPERLINK_APPID), (1000, str(link))]
         if description:
-            xdata.append((1002, '{'))
-            xdata.append((1000, str(description)))
             if location:
-                xdata.append((1000, str(location)))
-            xdata.append((1002, '}'))
+                xdata.extend(((1002, '{'), (1000, str(description)), (1000, str(location)), (1002, '}')))
+            else:
+                xdata.extend(((1002, '{'), (1000, str(description)), (1002, '}')))
 
-        self.discard_xdata('PE_URL')
-        self.set_xdata('PE_URL', xdata)
-        if self.doc and 'PE_URL' not in self.doc.appids:
-            self.doc.appids.new('PE_URL')
+        self.discard_xdata(HYPERLINK_APPID)
+        self.set_xdata(HYPERLINK_APPID, xdata)
+        if self.doc and HYPERLINK_APPID not in self.doc.appids:
+            self.doc.appids.new(HYPERLINK_APPID)
         return self
 
     def get_hyperlink(self) -> Tuple[str, str, str]:
@@ -348,18 +381,19 @@ class DXFGraphic(DXFEntity):
         .. versionadded:: 0.12
 
         """
-        link = ""
-        description = ""
-        location = ""
-        if self.xdata and 'PE_URL' in self.xdata:
-            xdata = [tag.value for tag in self.get_xdata('PE_URL') if tag.code == 1000]
-            if len(xdata):
-                link = xdata[0]
-            if len(xdata) > 1:
-                description = xdata[1]
-            if len(xdata) > 2:
-                location = xdata[2]
-        return link, description, location
+        xdata = self.xdata
+        if xdata is None or HYPERLINK_APPID not in xdata:
+            return '', '', ''
+        # link, description and location are the first three strings, stop scanning after them
+        values = ['', '', '']
+        index = 0
+        for tag in xdata.get(HYPERLINK_APPID):
+            if tag.code == 1000:
+                values[index] = tag.value
+                index += 1
+                if index == 3:
+                    break
+        return values[0], values[1], values[2]
 
 
 @register_entity
@@ -384,13 +418,13 @@ def entity_linker() -> Callable[[DXFEntity], bool]:
     main_entity = None  # type: Optional[DXFEntity]
     prev = None  # type: Optional[DXFEntity] # store preceding entity
     expected = ""
+    get_linked_type = LINKED_ENTITIES.get
 
     def entity_linker_(entity: DXFEntity) -> bool:
         nonlocal main_entity, expected, prev
         dxftype = entity.dxftype()  # type: str
-        are_linked_entities = False  # INSERT & POLYLINE are not linked entities, they are stored in the entity space
         if main_entity is not None:
-            are_linked_entities = True  # VERTEX, ATTRIB & SEQEND are linked tags, they are NOT stored in the entity space
+            # VERTEX, ATTRIB & SEQEND are linked tags, they are NOT stored in the entity space
             if dxftype == 'SEQEND':
                 main_entity.link_seqend(entity)
                 main_entity = None
@@ -399,8 +433,13 @@ def entity_linker() -> Callable[[DXFEntity], bool]:
                 main_entity.link_entity(entity)
             else:
                 raise DXFStructureError("expected DXF entity {} or SEQEND".format(dxftype))
+            prev = entity
+            return True  # inform caller that `entity` is linked to a parent entity
+
+        are_linked_entities = False  # INSERT & POLYLINE are not linked entities, they are stored in the entity space
+        linked_type = get_linked_type(dxftype)
         # linked entities
-        elif dxftype in LINKED_ENTITIES:  # only these two DXF types have this special linked structure
+        if linked_type is not None:  # only these two DXF types have this special linked structure
             if dxftype == 'INSERT' and not entity.dxf.get('attribs_follow', 0):
                 # INSERT must not have following ATTRIBS, ATTRIB can be a stand alone entity:
                 #   INSERT with no ATTRIBS, attribs_follow == 0
@@ -414,7 +453,7 @@ def entity_linker() -> Callable[[DXFEntity], bool]:
                 pass
             else:
                 main_entity = entity
-                expected = LINKED_ENTITIES[dxftype]
+                expected = linked_type
         # attached entities
         elif (dxftype == 'MTEXT') and (entity.dxf.handle is None):  # attached MTEXT entity
             if prev:
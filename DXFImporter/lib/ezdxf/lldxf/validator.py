@@ -245,7 +245,7 @@ def is_dxf_stream(stream: TextIO) -> bool:
 
 
 def is_valid_layer_name(name: str) -> bool:
-    return not bool(INVALID_LAYER_NAME_CHARACTERS.intersection(set(name)))
+    return INVALID_LAYER_NAME_CHARACTERS.isdisjoint(name)
 
 
 is_valid_name = is_valid_layer_name
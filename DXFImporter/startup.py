@@ -0,0 +1,44 @@
+"""
+startup.py
+==========
+Makes the libraries bundled in the add-in's lib folder importable.
+
+Rather than putting the lib folder on sys.path, where every import made by
+anything running in Fusion 360 would have to search it, a finder is placed
+on sys.meta_path that only answers for the top level packages we ship.
+"""
+import sys
+from importlib.abc import MetaPathFinder
+from importlib.machinery import PathFinder
+
+from . import config
+
+# Top level packages and modules that live in the lib folder
+LIB_PACKAGES = frozenset(('ezdxf', 'pyparsing'))
+
+
+class LibFinder(MetaPathFinder):
+    """Resolves the bundled top level packages from a single directory"""
+
+    def __init__(self, lib_path: str, names=LIB_PACKAGES):
+        self.lib_path = lib_path
+        self.names = names
+
+    def find_spec(self, fullname, path=None, target=None):
+        # Sub-modules are found through their parent package's __path__
+        if path is None and fullname in self.names:
+            return PathFinder.find_spec(fullname, [self.lib_path])
+        return None
+
+
+_finder = LibFinder(config.lib_path)
+
+
+def setup_app():
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
+
+
+def cleanup_app():
+    if _finder in sys.meta_path:
+        sys.meta_path.remove(_finder)